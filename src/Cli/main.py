@@ -8,62 +8,100 @@ Functions
 ---------
 ``_print_hourly(data)`` – print a summary of hourly forecast data.
 ``_print_daily(data)`` – print a summary of 12‑hour forecast data.
+``_cmd_*(args)`` – command handlers dispatched through ``COMMANDS``.
 ``main(argv)`` – entry point that parses arguments and dispatches commands.
 
 Usage
 -----
-``python -m Cli.main {update-all, show-hourly, show-daily} [--location
-LOCATION]``
+``python -m Cli.main [--location LOCATION] {update-all, show-hourly,
+show-daily}``
 """
 
 from __future__ import annotations
 
 import argparse
-from typing import Optional
+import logging
+import sys
+from typing import TYPE_CHECKING, Optional
 
+# ``weather.api`` defers importing requests and Pydantic until a request is
+# made or a cache file is loaded, so ``--help`` and argument errors stay cheap.
 from weather import api
-from weather.models import ForecastData
-
-# Mapping from location labels to NWS grid coordinates
-# used throughout the CLI.
-GRID_POINTS = {
-    "home": (40, 68),
-    "work": (56, 70),
-    "church": (34, 60),
-    "ehhs": (61, 62),
-}
+
+if TYPE_CHECKING:
+    from weather.models import ForecastData
+
+# Valid ``--location`` values, computed once for argparse
+_LOCATION_CHOICES = tuple(api.GRID_POINTS)
 
 
 def _print_hourly(data: ForecastData) -> None:
     """
     Print a simple summary of hourly forecast data to the console.
 
+    The summary is written with a single call instead of one ``print`` per
+    period.
+
     Args:
-        data (dict): The forecast data dictionary as returned by the API.
+        data (ForecastData): The cached hourly forecast.
     """
-    periods = getattr(getattr(data, "properties", {}), "periods", [])
-    for period in periods:
-        temp = period.get("temperature")
-        unit = period.get("temperatureUnit")
-        short = period.get("shortForecast")
-        start = period.get("startTime")
-        print(f"{start}: {temp}{unit} - {short}")
+    periods = getattr(data.data.properties, "periods", [])
+    lines = [
+        f"{p.startTime.isoformat()}: {p.temperature}{p.temperatureUnit}"
+        f" - {p.shortForecast}\n"
+        for p in periods
+    ]
+    sys.stdout.write("".join(lines))
 
 
 def _print_daily(data: ForecastData) -> None:
     """
     Print a simple summary of 12-hour forecast data to the console.
 
+    The summary is written with a single call instead of one ``print`` per
+    period.
+
     Args:
-        data (dict): The forecast data dictionary as returned by the API.
+        data (ForecastData): The cached 12-hour forecast.
     """
-    periods = getattr(getattr(data, "properties", {}), "periods", [])
-    for period in periods:
-        name = period.get("name")
-        temp = period.get("temperature")
-        unit = period.get("temperatureUnit")
-        short = period.get("shortForecast")
-        print(f"{name}: {temp}{unit} - {short}")
+    periods = getattr(data.data.properties, "periods", [])
+    lines = [
+        f"{p.name}: {p.temperature}{p.temperatureUnit} - {p.shortForecast}\n"
+        for p in periods
+    ]
+    sys.stdout.write("".join(lines))
+
+
+def _cmd_update_all(args: argparse.Namespace) -> None:
+    """Fetch and cache forecasts for every known location."""
+    api.update_all_forecasts(list(api.GRID_POINTS))
+
+
+def _cmd_show_hourly(args: argparse.Namespace) -> None:
+    """Display the latest cached hourly forecast for ``args.location``."""
+    data = api.load_cached_data(f"{args.location}_CACHED_HOURLY_DATA.json")
+    if data is not None:
+        _print_hourly(data)
+    else:
+        print("No cached hourly data found for the selected location.")
+
+
+def _cmd_show_daily(args: argparse.Namespace) -> None:
+    """Display the latest cached 12h forecast for ``args.location``."""
+    cache_file = f"{args.location}_CACHED_FORECAST_DATA.json"
+    data = api.load_cached_data(cache_file)
+    if data is not None:
+        _print_daily(data)
+    else:
+        print("No cached daily data found for the selected location.")
+
+
+# Mapping from command names to their handlers
+COMMANDS = {
+    "update-all": _cmd_update_all,
+    "show-hourly": _cmd_show_hourly,
+    "show-daily": _cmd_show_daily,
+}
 
 
 def main(argv: Optional[list[str]] = None) -> None:
@@ -76,60 +114,29 @@ def main(argv: Optional[list[str]] = None) -> None:
             uses ``sys.argv``.
     """
     parser = argparse.ArgumentParser(description="weather forecast utilities")
-
-    sub_cmd = parser.add_subparsers(dest="command")
-
-    # Add subparsers and move --location to each
-    update_all_parser = sub_cmd.add_parser(
-        "update-all", help="Fetch and cache all forecasts"
-    )
-    update_all_parser.add_argument(
-        "-l",
-        "--location",
-        choices=GRID_POINTS.keys(),
-        default="home",
-        help="Location to fetch the forecast for",
-    )
-
-    show_hourly_parser = sub_cmd.add_parser(
-        "show-hourly", help="Display the latest hourly forecast"
-    )
-    show_hourly_parser.add_argument(
+    parser.add_argument(
         "-l",
         "--location",
-        choices=GRID_POINTS.keys(),
+        choices=_LOCATION_CHOICES,
         default="home",
         help="Location to fetch the forecast for",
     )
-
-    show_daily_parser = sub_cmd.add_parser(
-        "show-daily", help="Display the latest 12h forecast"
-    )
-    show_daily_parser.add_argument(
-        "-l",
-        "--location",
-        choices=GRID_POINTS.keys(),
-        default="home",
-        help="Location to fetch the forecast for",
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=tuple(COMMANDS),
+        help="update-all: fetch and cache all forecasts; "
+        "show-hourly: display the latest hourly forecast; "
+        "show-daily: display the latest 12h forecast",
     )
 
     args = parser.parse_args(argv)
+    # ``weather.api`` reports progress through logging rather than print
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-    if args.command == "update-all":
-        api.update_all_forecasts(["home", "work", "church", "ehhs"])
-    elif args.command == "show-hourly":
-        data = api.load_cached_data(f"{args.location}_CACHED_HOURLY_DATA.json")
-        if data is not None:
-            _print_hourly(data)
-        else:
-            print("No cached hourly data found for the selected location.")
-    elif args.command == "show-daily":
-        cache_file = f"{args.location}_CACHED_FORCAST_DATA.json"
-        data = api.load_cached_data(cache_file)
-        if data is not None:
-            _print_daily(data)
-        else:
-            print("No cached daily data found for the selected location.")
+    handler = COMMANDS.get(args.command)
+    if handler is not None:
+        handler(args)
     else:
         parser.print_help()
 
@@ -1,10 +1,14 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import time
 
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from weather import api, models
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -15,6 +19,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Seconds a serialized forecast response is reused before it is rebuilt
+_RESPONSE_TTL = 600
+# Headers letting browsers and proxies reuse a forecast response as well
+_RESPONSE_HEADERS = {"Cache-Control": f"public, max-age={_RESPONSE_TTL}"}
+# Serialized forecast responses keyed by location, with their build time
+_RESPONSE_CACHE: dict[str, tuple[float, bytes]] = {}
+
 
 def get_weather_data(location: str) -> models.ForecastData | None:
     """
@@ -23,19 +34,31 @@ def get_weather_data(location: str) -> models.ForecastData | None:
     return api.load_cached_data(f"{location}_CACHED_FORECAST_DATA.json")
 
 
-@app.get("/v1/api/weather/{location}")
-async def weather_api(location: str):
-    weatherData = get_weather_data(location)
-    if weatherData is None:
-        return {"error": "No weather data available."}
-    forecast_data = weatherData.getForecast()
-    return {"weatherData": forecast_data}
-
-
+# Registered before the ``{location}`` route so it is not shadowed by it
 @app.get("/v1/api/weather/update")
 async def update_weather_api():
     """
-    Updates the weather data for a given location.
+    Updates the weather data for a given location. The blocking fetch runs in
+    the threadpool so other requests keep being served meanwhile.
     """
-    api.update_all_forecasts(["home", "work", "church", "ehhs"])
+    await run_in_threadpool(api.update_all_forecasts, list(api.GRID_POINTS))
+    _RESPONSE_CACHE.clear()
     return {"message": "Weather data updated successfully."}
+
+
+@app.get("/v1/api/weather/{location}")
+async def weather_api(location: str):
+    """
+    Returns the cached 12h forecast for a location. The serialized response
+    is kept in memory for ``_RESPONSE_TTL`` seconds.
+    """
+    now = time.monotonic()
+    built_at, body = _RESPONSE_CACHE.get(location, (0.0, b""))
+    if not body or now - built_at >= _RESPONSE_TTL:
+        weatherData = get_weather_data(location)
+        if weatherData is None:
+            return {"error": "No weather data available."}
+        forecast_data = weatherData.getForecast()
+        body = orjson.dumps({"weatherData": forecast_data})
+        _RESPONSE_CACHE[location] = (now, body)
+    return Response(body, media_type="application/json", headers=_RESPONSE_HEADERS)
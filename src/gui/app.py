@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import StringVar, ttk
 from tkinter.scrolledtext import ScrolledText
-from turtle import update
 
 from weather import api
 
@@ -30,7 +29,7 @@ def search_weather(search_box, forecast, location_state):
 
 
 def update_weather():
-    api.update_all_forecasts(["home", "work", "church", "ehhs"])
+    api.update_all_forecasts(list(api.GRID_POINTS))
 
 
 def main():
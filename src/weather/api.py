@@ -2,7 +2,9 @@
 
 This module wraps the National Weather Service API. It can retrieve hourly
 and 12-hour forecasts as well as raw gridpoint data. Responses are cached to
-``data/`` for later use.
+``data/`` for later use. HTTP responses are also kept in
+``data/http_cache.sqlite`` and reused for as long as the NWS
+``Cache-Control`` headers allow, revalidating with ``ETag`` afterwards.
 
 Constants
 ---------
@@ -20,19 +22,43 @@ Key Functions
 ``fetch_hourly_forecast(location)`` – get the hourly forecast
 ``fetch_gridpoint_raw_data(location)`` – get raw gridpoint data
 ``load_cached_data(filename)`` – load cached forecast data
+``load_cached_layer(filename, layer)`` – load one raw gridpoint layer
 ``cache_forecast(data, filename)`` – save forecast data to ``data/``
 """
 
+from __future__ import annotations
+
+import atexit
+import functools
 import logging
-import requests
-import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+import orjson
+
+# ``requests`` and the Pydantic models are imported where they are used so
+# that importing this module stays cheap for callers that never touch them.
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    import requests
+    import requests_cache
+
+    from weather import models
 
-from weather import models
+logger = logging.getLogger(__name__)
 
 # Base URL for NWS gridpoint API requests
 BASE_URL = "https://api.weather.gov/gridpoints/GSP/"
 # Identifier sent with HTTP requests
 USER_AGENT = "weather-learner/1.0"
+# Seconds to wait for the NWS API before giving up on a request
+_TIMEOUT = 10
+# Upper bound on concurrent requests issued by ``update_all_forecasts``
+_MAX_WORKERS = 16
 
 # Mapping from location labels to NWS grid coordinates
 GRID_POINTS = {
@@ -47,6 +73,55 @@ CACHED_HOURLY_DATA = "cached_hourly_data.json"
 CACHED_FORCAST_DATA = "cached_forecast_data.json"
 CACHED_RAW_DATA = "cached_raw_data.json"
 
+# Session shared by all NWS requests, created by ``_get_session``
+_SESSION: requests_cache.CachedSession | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests_cache.CachedSession:
+    """
+    Return the session shared by all NWS requests, creating it on first use.
+    Creation is locked so that worker threads racing on the first request
+    still end up sharing a single session.
+
+    Every request reuses pooled keep-alive connections instead of paying a
+    fresh TCP/TLS handshake per call. Responses are stored on disk and served
+    without a request while the NWS ``Cache-Control`` max-age holds; stale
+    entries are revalidated with ``If-None-Match`` and reused on a 304 or, for
+    up to an hour, when the API is unreachable.
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _create_session()
+    return _SESSION
+
+
+def _create_session() -> requests_cache.CachedSession:
+    """Build the cached, pooled session returned by ``_get_session``."""
+    import requests_cache
+    from requests.adapters import HTTPAdapter
+
+    session = requests_cache.CachedSession(
+        "data/http_cache",
+        backend="sqlite",
+        cache_control=True,
+        expire_after=900,
+        stale_if_error=3600,
+    )
+    # Sent with every request, alongside requests' default gzip/deflate
+    # ``Accept-Encoding``
+    session.headers.update({"User-Agent": USER_AGENT})
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=_MAX_WORKERS),
+    )
+    # Close the pooled sockets and the SQLite cache connection cleanly
+    atexit.register(session.close)
+    return session
+
 
 def update_all_forecasts(locations: list[str]) -> None:
     """
@@ -59,26 +134,107 @@ def update_all_forecasts(locations: list[str]) -> None:
 
     This function fetches the latest 12-hour forecast, hourly forecast and raw
     gridpoint data from the NWS API for the specified location, then saves each
-    to its respective cache file in the ``data/`` directory.
+    to its respective cache file in the ``data/`` directory. All requests are
+    issued concurrently over the shared session.
     """
+    fetchers = (
+        (_fetch_forecast, "FORECAST"),
+        (_fetch_hourly_forecast, "HOURLY"),
+        (_fetch_gridpoint_raw_data, "RAW"),
+    )
+    jobs = []
     for location in locations:
-        if location not in GRID_POINTS:
-            logging.error(f"Unknown location: {location}")
+        coords = GRID_POINTS.get(location)
+        if coords is None:
+            logger.error("Unknown location: %s", location)
             continue
 
-        print(f"Fetching latest forecast data for {location}...")
-        forecast_data = _fetch_forecast(GRID_POINTS[location])
-        hourly_forecast_data = _fetch_hourly_forecast(GRID_POINTS[location])
-        gridpoint_raw_data = _fetch_gridpoint_raw_data(GRID_POINTS[location])
+        logger.info("Fetching latest forecast data for %s...", location)
+        for fetch, name in fetchers:
+            jobs.append((fetch, location, coords, name))
 
-        _cache_forecast(forecast_data, f"{location}_CACHED_FORECAST_DATA.json")
-        _cache_forecast(hourly_forecast_data, f"{location}_CACHED_HOURLY_DATA.json")
-        _cache_forecast(gridpoint_raw_data, f"{location}_CACHED_RAW_DATA.json")
+    # The requests are I/O bound, so threads overlap the network waits and
+    # the batch takes roughly as long as the slowest single request. Each
+    # worker also decodes and writes its own response so that work overlaps
+    # too instead of queueing up behind the main thread.
+    workers = max(1, min(len(jobs), _MAX_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_update_forecast, fetch, location, coords, name)
+            for fetch, location, coords, name in jobs
+        ]
+        for future in as_completed(futures):
+            future.result()
 
-    print("All forecasts updated.")
+    logger.info("All forecasts updated.")
 
 
-def _fetch_forecast(location: tuple[int, int]) -> dict[str, dict]:
+def _update_forecast(fetch, location: str, coords: tuple[int, int], name: str) -> None:
+    """
+    Fetch one forecast for a location and write it to its cache file.
+
+    Args:
+        fetch: One of the ``_fetch_*`` functions.
+        location (str): The location key to fetch the forecast for.
+        coords (tuple[int, int]): The location's NWS grid coordinates.
+        name (str): The cache file label (``FORECAST``, ``HOURLY`` or
+            ``RAW``).
+    """
+    filename = f"{location}_CACHED_{name}_DATA.json"
+    response = fetch(coords)
+    # Keep the previous cache file rather than replacing it with an error body
+    if not response.ok:
+        logger.error(
+            "Fetching %s failed with HTTP %s; keeping the cached copy",
+            filename,
+            response.status_code,
+        )
+        return
+    # Skip the decode and disk I/O only if the cache file was written after
+    # the HTTP cache stored this response. A revalidated 304 for a body whose
+    # earlier write failed still has to be written out.
+    if response.from_cache and _written_since(filename, response.created_at):
+        logger.info("%s is up to date", filename)
+        return
+    _cache_forecast(orjson.loads(response.content), filename)
+
+
+def _written_since(filename: str, created_at: datetime) -> bool:
+    """
+    Return whether a cache file in the data/ directory was last written at
+    or after ``created_at``.
+
+    Args:
+        filename (str): The name of the cache file relative to the
+            ``data/`` directory.
+        created_at (datetime): When the HTTP cache stored the response.
+    Returns:
+        bool: ``False`` if the file is older or does not exist.
+    """
+    try:
+        mtime = os.stat(f"data/{filename}").st_mtime
+    except FileNotFoundError:
+        return False
+    return mtime >= created_at.timestamp()
+
+
+@functools.cache
+def _gridpoint_url(location: tuple[int, int], path: str = "") -> str:
+    """
+    Build the NWS gridpoint URL for a location, reusing the string on later
+    calls.
+
+    Args:
+        location (tuple[int, int]): The (x, y) grid coordinates.
+        path (str): Endpoint path appended to the gridpoint URL, e.g.
+            ``"/forecast"``.
+    Returns:
+        str: The full request URL.
+    """
+    return f"{BASE_URL}{location[0]},{location[1]}{path}"
+
+
+def _fetch_forecast(location: tuple[int, int]) -> requests.Response:
     """
     Fetch the latest 12-hour forecast data from the NWS API for a
     given location.
@@ -87,15 +243,16 @@ def _fetch_forecast(location: tuple[int, int]) -> dict[str, dict]:
         location (tuple[int, int]): The (x, y) grid coordinates for the
             NWS API endpoint.
     Returns:
-        dict[str, dict]: The JSON response from the API as a dictionary.
+        requests.Response: The API response, possibly served from the HTTP
+            cache.
     """
-    return requests.get(
-        f"{BASE_URL}{location[0]},{location[1]}/forecast",
-        headers={"User-Agent": USER_AGENT},
-    ).json()
+    return _get_session().get(
+        _gridpoint_url(location, "/forecast"),
+        timeout=_TIMEOUT,
+    )
 
 
-def _fetch_hourly_forecast(location: tuple[int, int]) -> dict[str, dict]:
+def _fetch_hourly_forecast(location: tuple[int, int]) -> requests.Response:
     """
     Fetch the latest hourly forecast data from the NWS API for a
     given location.
@@ -104,15 +261,16 @@ def _fetch_hourly_forecast(location: tuple[int, int]) -> dict[str, dict]:
         location (tuple[int, int]): The (x, y) grid coordinates for the
             NWS API endpoint.
     Returns:
-        dict[str, dict]: The JSON response from the API as a dictionary.
+        requests.Response: The API response, possibly served from the HTTP
+            cache.
     """
-    return requests.get(
-        f"{BASE_URL}{location[0]},{location[1]}/forecast/hourly",
-        headers={"User-Agent": USER_AGENT},
-    ).json()
+    return _get_session().get(
+        _gridpoint_url(location, "/forecast/hourly"),
+        timeout=_TIMEOUT,
+    )
 
 
-def _fetch_gridpoint_raw_data(location: tuple[int, int]) -> dict[str, dict]:
+def _fetch_gridpoint_raw_data(location: tuple[int, int]) -> requests.Response:
     """
     Fetch the latest raw gridpoint forecast data from the NWS API for a
     given location.
@@ -121,18 +279,23 @@ def _fetch_gridpoint_raw_data(location: tuple[int, int]) -> dict[str, dict]:
         location (tuple[int, int]): The (x, y) grid coordinates for the
             NWS API endpoint.
     Returns:
-        dict[str, dict]: The JSON response from the API as a dictionary.
+        requests.Response: The API response, possibly served from the HTTP
+            cache.
     """
-    return requests.get(
-        f"{BASE_URL}{location[0]},{location[1]}",
-        headers={"User-Agent": USER_AGENT},
-    ).json()
+    return _get_session().get(
+        _gridpoint_url(location),
+        timeout=_TIMEOUT,
+    )
 
 
 def load_cached_data(filename: str) -> models.ForecastData | None:
     """
     Load cached forecast data from a file in the data/ directory.
 
+    Parsed files are memoized by inode, size and modification time, so
+    repeated loads of an unchanged file return the already validated model,
+    while a file rewritten by any process is parsed again.
+
     Args:
         filename (str): The name of the cache file relative to the
             ``data/`` directory.
@@ -141,42 +304,164 @@ def load_cached_data(filename: str) -> models.ForecastData | None:
             ``None`` if the file does not exist.
     """
     try:
-        with open(f"data/{filename}", "r") as f:
-            import json
-
-            raw_data = json.load(f)
-
-            # Determine the forecast type based on the filename pattern and
-            # create the appropriate model
-            if "FORCAST_DATA" in filename:  # 12-hour forecast
-                geojson_data = models.Gridpoint12hForecastGeoJson(**raw_data)
-                return models.ForecastData(kind="12h", data=geojson_data)
-            elif "HOURLY_DATA" in filename:  # Hourly forecast
-                hourly_geojson_data = models.GridpointHourlyForecastGeoJson(**raw_data)
-                return models.ForecastData(kind="hourly", data=hourly_geojson_data)
-            elif "RAW_DATA" in filename:  # Raw gridpoint data
-                raw_geojson_data = models.GridpointGeoJson(**raw_data)
-                return models.ForecastData(kind="gridpoint", data=raw_geojson_data)
-            else:
-                # Default to 12h forecast if pattern doesn't match
-                default_geojson_data = models.Gridpoint12hForecastGeoJson(**raw_data)
-                return models.ForecastData(kind="12h", data=default_geojson_data)
+        st = os.stat(f"data/{filename}")
+        return _load_by_stat(filename, st.st_ino, st.st_size, st.st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error("Error loading cached data from %s: %s", filename, e)
+        return None
 
+
+def load_cached_layer(
+    filename: str, layer_name: str
+) -> models.GridpointQuantitativeValueLayer | None:
+    """
+    Load a single layer, e.g. ``"temperature"`` or ``"skyCover"``, from a
+    cached raw gridpoint file in the data/ directory.
+
+    Only the requested layer is validated into a model, so any layer in the
+    file can be read, including ones ``models.GridpointGeoJson`` does not
+    declare, without paying for the geometry or the other layers. Results
+    are memoized like ``load_cached_data``.
+
+    Args:
+        filename (str): The name of the raw gridpoint cache file relative to
+            the ``data/`` directory.
+        layer_name (str): The gridpoint property holding the layer.
+    Returns:
+        models.GridpointQuantitativeValueLayer: The requested layer, or
+            ``None`` if the file or layer is missing or the property is not
+            a quantitative value layer (e.g. ``"weather"``).
+    """
+    try:
+        st = os.stat(f"data/{filename}")
+        return _load_layer_by_stat(
+            filename, layer_name, st.st_ino, st.st_size, st.st_mtime_ns
+        )
     except FileNotFoundError:
         return None
     except Exception as e:
-        logging.error(f"Error loading cached data from {filename}: {e}")
+        logger.error("Error loading %s from %s: %s", layer_name, filename, e)
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_layer_by_stat(
+    filename: str, layer_name: str, ino: int, size: int, mtime_ns: int
+) -> models.GridpointQuantitativeValueLayer | None:
+    """
+    Parse one layer of a raw gridpoint cache file.
+
+    ``ino``, ``size`` and ``mtime_ns`` are only part of the cache key, as for
+    ``_load_by_stat``.
+
+    Args:
+        filename (str): The name of the cache file relative to the
+            ``data/`` directory.
+        layer_name (str): The gridpoint property holding the layer.
+        ino (int): The file's inode number.
+        size (int): The file's size in bytes.
+        mtime_ns (int): The file's modification time.
+    Returns:
+        models.GridpointQuantitativeValueLayer: The parsed layer, or ``None``
+            if it is missing or not a quantitative value layer.
+    """
+    from pydantic import ValidationError
+
+    from weather import models
+
+    with open(f"data/{filename}", "rb") as f:
+        raw_data = orjson.loads(f.read())
+    properties = raw_data.get("properties") if isinstance(raw_data, dict) else None
+    layer = properties.get(layer_name) if isinstance(properties, dict) else None
+    if not isinstance(layer, dict):
         return None
+    try:
+        return models.GridpointQuantitativeValueLayer.model_validate(layer)
+    except ValidationError:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_by_stat(
+    filename: str, ino: int, size: int, mtime_ns: int
+) -> models.ForecastData:
+    """
+    Parse a cache file into a ``ForecastData`` object.
+
+    ``ino``, ``size`` and ``mtime_ns`` are only part of the cache key. Every
+    write replaces the file with ``os.replace`` and so gives it a new inode,
+    which means a rewrite is noticed even within one mtime tick.
+
+    Args:
+        filename (str): The name of the cache file relative to the
+            ``data/`` directory.
+        ino (int): The file's inode number.
+        size (int): The file's size in bytes.
+        mtime_ns (int): The file's modification time.
+    Returns:
+        models.ForecastData: The parsed forecast data.
+    """
+    from weather import models
+
+    with open(f"data/{filename}", "rb") as f:
+        raw_data = f.read()
+
+    # Determine the forecast type from the filename suffix and create the
+    # appropriate model, defaulting to a 12h forecast for unknown names
+    suffix = filename.partition("_CACHED_")[2]
+    model, kind = _models_by_suffix().get(
+        suffix, (models.Gridpoint12hForecastGeoJson, "12h")
+    )
+    # Validating straight from bytes lets pydantic-core parse the JSON without
+    # building an intermediate dict first.
+    return models.ForecastData(kind=kind, data=model.model_validate_json(raw_data))
+
+
+@functools.cache
+def _models_by_suffix() -> dict[str, tuple[type, str]]:
+    """
+    Return the model class and ``ForecastData`` kind for each cache file
+    suffix (the part after ``_CACHED_``) written by ``update_all_forecasts``.
+    """
+    from weather import models
+
+    return {
+        "FORECAST_DATA.json": (models.Gridpoint12hForecastGeoJson, "12h"),
+        "HOURLY_DATA.json": (models.GridpointHourlyForecastGeoJson, "hourly"),
+        "RAW_DATA.json": (models.GridpointGeoJson, "gridpoint"),
+    }
 
 
 def _cache_forecast(forecast_data, filename) -> None:
     """
     Cache the forecast data to a file in JSON format in the data/ directory.
+    The file is replaced atomically.
 
     Args:
         forecast_data: The data to be cached (should be serializable to JSON).
         filename: The name of the cache file (relative to the data/ directory).
     """
-    with open(f"data/{filename}", "w") as f:
-        json.dump(forecast_data, f, indent=4)
-    logging.log(msg=f"Forecast data saved to {filename}", level=logging.INFO)
+    # The files are only read back by ``load_cached_data``, so they are
+    # stored compactly. Encoding before the temporary file is created means
+    # a payload that fails to serialize leaves nothing behind.
+    payload = orjson.dumps(forecast_data)
+    os.makedirs("data", exist_ok=True)
+    # Write to a temporary file and rename it over the old one so readers
+    # never see a half-written cache file, even after a crash.
+    with tempfile.NamedTemporaryFile(
+        "wb", dir="data", prefix=f".{filename}.", suffix=".tmp", delete=False
+    ) as f:
+        try:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+            # Temporary files are created private; cache files are not
+            os.chmod(f.name, 0o644)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, f"data/{filename}")
+    logger.info("Forecast data saved to %s", filename)
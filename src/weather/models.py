@@ -13,22 +13,40 @@ way throughout the application.
 
 Classes:
     _QuantitativeValue – value with units (e.g., temperature, elevation)
+    _ForecastPeriod – fields shared by 12-hour and hourly forecast periods
     _Gridpoint12hForecastPeriod – a single 12-hour forecast period
     _GeoJsonGeometry – the geometry section of a GeoJSON feature
+    _Forecast – metadata shared by 12-hour and hourly forecasts
     _Gridpoint12hForecast – a 12-hour forecast for a gridpoint
     _GridpointHourlyForecastPeriod – a single hourly forecast period
     _GridpointHourlyForecast – an hourly forecast for a gridpoint
     _GridpointQuantitativeValueLayer – a layer of quantitative values for a
         gridpoint (e.g., temperature, humidity)
+    GridpointQuantitativeValueLayer – public name for the layer model
     _Gridpoint – raw forecast data for a 2.5km grid square
     GridpointGeoJson – a GeoJSON feature for gridpoint data
     Gridpoint12hForecastGeoJson – a GeoJSON feature for 12-hour data
     GridpointHourlyForecastGeoJson – a GeoJSON feature for hourly data
 """
 
-from datetime import datetime
-from pydantic import BaseModel, Discriminator, Field
-from typing import Annotated, Any, Union, Literal
+import functools
+from datetime import UTC, datetime
+from pydantic import BaseModel, ConfigDict, Discriminator, Field
+from typing import TYPE_CHECKING, Annotated, Any, Union, Literal
+
+# NumPy and pandas are only needed for the columnar layer views, so they are
+# imported on first use.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+__all__ = [
+    "ForecastData",
+    "Gridpoint12hForecastGeoJson",
+    "GridpointGeoJson",
+    "GridpointHourlyForecastGeoJson",
+    "GridpointQuantitativeValueLayer",
+]
 
 
 class _QuantitativeValue(BaseModel):
@@ -42,6 +60,10 @@ class _QuantitativeValue(BaseModel):
             'wmoUnit:percent').
     """
 
+    # ``load_cached_data`` hands the same memoized instances to every caller,
+    # so the small, numerous value models are immutable.
+    model_config = ConfigDict(frozen=True)
+
     value: int | float
     unitCode: str
 
@@ -50,16 +72,16 @@ class _QuantitativeValue(BaseModel):
         return f"{self.value} {self.unitCode}"
 
 
-class _Gridpoint12hForecastPeriod(BaseModel):
+class _ForecastPeriod(BaseModel):
     """
-    Represents a single 12-hour forecast period, including temperature,
+    Fields shared by 12-hour and hourly forecast periods: temperature,
     precipitation, wind and forecast text.
 
     Attributes:
         number (int): Sequence number of the period.
-        name (str): Name of the period (e.g., 'Tonight', 'Monday').
-        startTime (str): ISO8601 start time.
-        endTime (str): ISO8601 end time.
+        name (str): Name of the period (e.g., 'Tonight', '1am').
+        startTime (datetime): Start time, parsed from ISO8601 on validation.
+        endTime (datetime): End time, parsed from ISO8601 on validation.
         isDaytime (bool): True if the period is during the day.
         temperature (int | None): Temperature value.
         temperatureUnit (str | None): Unit of temperature.
@@ -73,10 +95,12 @@ class _Gridpoint12hForecastPeriod(BaseModel):
         detailedForecast (str | None): Detailed text summary.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     number: int
     name: str
-    startTime: str
-    endTime: str
+    startTime: datetime
+    endTime: datetime
     isDaytime: bool
     temperature: int | None = None
     temperatureUnit: str | None = None
@@ -88,6 +112,13 @@ class _Gridpoint12hForecastPeriod(BaseModel):
     shortForecast: str | None = None
     detailedForecast: str | None = None
 
+
+class _Gridpoint12hForecastPeriod(_ForecastPeriod):
+    """
+    Represents a single 12-hour forecast period. See ``_ForecastPeriod`` for
+    the attributes.
+    """
+
     def __str__(self) -> str:
         """Return ``"{name}: {forecast}"`` for quick display."""
         forecast = (
@@ -104,20 +135,35 @@ class _GeoJsonGeometry(BaseModel):
     Attributes:
         type (str): The geometry type (e.g., 'Polygon').
         coordinates (list[list[list[float]]]): Coordinates of the geometry.
+        vertices (np.ndarray): Longitude and latitude of every ring's
+            positions stacked into one read-only ``(n, 2)`` ``float64``
+            array, dropping any altitude, built on first access.
     """
 
     type: str
     coordinates: list[list[list[float]]]
 
+    @functools.cached_property
+    def vertices(self) -> "np.ndarray":
+        """Return all positions as one array, e.g. for ``vertices.min(0)``."""
+        import numpy as np
+
+        # GeoJSON positions may carry an altitude after longitude and latitude
+        positions = [point[:2] for ring in self.coordinates for point in ring]
+        if any(len(point) != 2 for point in positions):
+            raise ValueError("GeoJSON positions need at least two coordinates")
+        vertices = np.array(positions, dtype=np.float64).reshape(-1, 2)
+        vertices.flags.writeable = False
+        return vertices
+
     def __str__(self) -> str:
         """Return a readable summary of the geometry."""
         return f"Geometry:\ntype: {self.type}\n\nCoordinates:\n{self.coordinates})"
 
 
-class _Gridpoint12hForecast(BaseModel):
+class _Forecast(BaseModel):
     """
-    Represents a 12-hour forecast for a gridpoint, including metadata and a
-    list of forecast periods.
+    Metadata shared by 12-hour and hourly gridpoint forecasts.
 
     Attributes:
         units (str): Units of measurement.
@@ -126,20 +172,32 @@ class _Gridpoint12hForecast(BaseModel):
         updateTime (str): ISO8601 timestamp of last update.
         validTimes (str): Valid time range for the forecast.
         elevation (_QuantitativeValue): Elevation of the gridpoint.
-        periods (list[_Gridpoint12hForecastPeriod]): List of forecast periods.
     """
 
-    type: Literal["12h"] = "12h"
     units: str
     forecastGenerator: str
     generatedAt: str
     updateTime: str
     validTimes: str
     elevation: _QuantitativeValue
+
+
+class _Gridpoint12hForecast(_Forecast):
+    """
+    Represents a 12-hour forecast for a gridpoint: the ``_Forecast``
+    metadata and a list of forecast periods.
+
+    Attributes:
+        periods (list[_Gridpoint12hForecastPeriod]): List of forecast periods.
+    """
+
+    type: Literal["12h"] = "12h"
     periods: list[_Gridpoint12hForecastPeriod]
 
     def __str__(self) -> str:
         """Return a detailed multiline description of the forecast."""
+        # Build the period list once and join it in a single pass
+        periods = "\n\n".join([str(period) for period in self.periods])
         return f"""
 Gridpoint 12h Forecast:
 Units: {self.units}
@@ -150,83 +208,40 @@ ValidTimes: {self.validTimes}
 Elevation: {self.elevation}
 
 Periods:
-{"\n\n".join(str(period) for period in self.periods)}
+{periods}
         """
 
 
-class _GridpointHourlyForecastPeriod(BaseModel):
+class _GridpointHourlyForecastPeriod(_ForecastPeriod):
     """
-    Represents a single hourly forecast period including temperature,
-    precipitation, wind and forecast text.
-
-    Attributes:
-        number (int): Sequence number of the period.
-        name (str): Name of the period (e.g., '1am').
-        startTime (str): ISO8601 start time.
-        endTime (str): ISO8601 end time.
-        isDaytime (bool): True if the period is during the day.
-        temperature (int | None): Temperature value.
-        temperatureUnit (str | None): Unit of temperature.
-        temperatureTrend (str | None): Trend of temperature.
-        probabilityOfPrecipitation (_QuantitativeValue | None):
-            Probability of precipitation.
-        windSpeed (str | None): Wind speed as a string.
-        windDirection (str | None): Wind direction.
-        icon (str | None): URL to an icon representing the forecast.
-        shortForecast (str | None): Short text summary.
-        detailedForecast (str | None): Detailed text summary.
+    Represents a single hourly forecast period. See ``_ForecastPeriod`` for
+    the attributes.
     """
 
-    number: int
-    name: str
-    startTime: str
-    endTime: str
-    isDaytime: bool
-    temperature: int | None = None
-    temperatureUnit: str | None = None
-    temperatureTrend: str | None = None
-    probabilityOfPrecipitation: _QuantitativeValue | None = None
-    windSpeed: str | None = None
-    windDirection: str | None = None
-    icon: str | None = None
-    shortForecast: str | None = None
-    detailedForecast: str | None = None
-
     def __str__(self) -> str:
         """Return the start time and brief forecast for one hour."""
-        starttime = datetime.fromisoformat(self.startTime)
         summary = (
             self.detailedForecast or self.shortForecast or ("No forecast available")
         )
-        return f"{starttime.ctime()}: {summary}"
+        return f"{self.startTime.ctime()}: {summary}"
 
 
-class _GridpointHourlyForecast(BaseModel):
+class _GridpointHourlyForecast(_Forecast):
     """
-    Represents an hourly forecast for a gridpoint, including metadata and a
-    list of hourly forecast periods.
+    Represents an hourly forecast for a gridpoint: the ``_Forecast``
+    metadata and a list of hourly forecast periods.
 
     Attributes:
-        units (str): Units of measurement.
-        forecastGenerator (str): Source of the forecast.
-        generatedAt (str): ISO8601 timestamp when generated.
-        updateTime (str): ISO8601 timestamp of last update.
-        validTimes (str): Valid time range for the forecast.
-        elevation (_QuantitativeValue): Elevation of the gridpoint.
         periods (list[_GridpointHourlyForecastPeriod]):
             List of hourly forecast periods.
     """
 
-    units: str
-    forecastGenerator: str
-    generatedAt: str
-    updateTime: str
-    validTimes: str
-    elevation: _QuantitativeValue
     periods: list[_GridpointHourlyForecastPeriod]
 
     def __str__(self) -> str:
         """Return a multiline representation of the hourly forecast."""
+        # Build the period list once and join it in a single pass
+        periods = "\n\n".join([str(period) for period in self.periods])
         return f"""
 Gridpoint Hourly Forecast:
 Units: {self.units}
@@ -237,11 +252,13 @@ ValidTimes: {self.validTimes}
 Elevation: {self.elevation}
 
 Periods:
-{"\n\n".join(str(period) for period in self.periods)}
+{periods}
 """
 
 
 class _GridpointQuantitativeValue(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     validTime: str
     value: Any
 
@@ -259,17 +276,68 @@ class _GridpointQuantitativeValueLayer(BaseModel):
         uom (str): Unit of measurement for the layer.
         values (list[dict[str, int | float | str]]):
             List of value dictionaries for the layer.
+        times (np.ndarray): Start of each value's valid interval as a
+            ``datetime64[s]`` read-only array in UTC, built on first access.
+        magnitudes (np.ndarray): The values as a read-only ``float32`` array with
+            missing values as NaN, built on first access.
     """
 
     uom: str
     values: list[_GridpointQuantitativeValue]
 
+    @functools.cached_property
+    def times(self) -> "np.ndarray":
+        """Return the start of every valid interval as one column."""
+        import numpy as np
+
+        starts = (
+            datetime.fromisoformat(value.validTime.partition("/")[0])
+            .astimezone(UTC)
+            .replace(tzinfo=None)
+            for value in self.values
+        )
+        times = np.fromiter(starts, dtype="datetime64[s]", count=len(self.values))
+        times.flags.writeable = False
+        return times
+
+    @functools.cached_property
+    def magnitudes(self) -> "np.ndarray":
+        """Return every value as one ``float32`` column."""
+        import numpy as np
+
+        values = (
+            np.nan if value.value is None else value.value for value in self.values
+        )
+        magnitudes = np.fromiter(values, dtype=np.float32, count=len(self.values))
+        # Shared with every caller of ``load_cached_data``, like the models
+        magnitudes.flags.writeable = False
+        return magnitudes
+
+    def to_pandas(self) -> "pd.Series":
+        """
+        Return the layer as a ``pandas.Series`` of ``magnitudes`` indexed by
+        ``times``, sharing the cached, read-only columns rather than copying
+        the values.
+        """
+        import pandas as pd
+
+        return pd.Series(
+            self.magnitudes,
+            index=pd.DatetimeIndex(self.times, name="validTime"),
+            name=self.uom,
+            copy=False,
+        )
+
     def __str__(self) -> str:
         """Return a line-per-value listing of the layer contents."""
-        values = ",\n".join(str(value) for value in self.values)
+        values = ",\n".join([str(value) for value in self.values])
         return f"{self.uom.split(':')[1]}: \n{values}"
 
 
+# Public name for the layer model returned by ``api.load_cached_layer``
+GridpointQuantitativeValueLayer = _GridpointQuantitativeValueLayer
+
+
 class _Gridpoint(BaseModel):
     """
     Represents raw forecast data for a 2.5km grid square, including many
@@ -414,10 +482,11 @@ class ForecastData(BaseModel):
 
     def getForecast(self) -> dict[str, Any]:
         """
-        Returns the forecast data as a dictionary.
+        Returns the forecast data as a dictionary of JSON-compatible values
+        (datetimes as ISO8601 strings).
         This is useful for serialization or further processing.
         """
-        return self.data.properties.model_dump()
+        return self.data.properties.model_dump(mode="json")
 
     def __str__(self):
         return f"{self.kind}: {self.data}"